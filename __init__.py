@@ -8,23 +8,48 @@ by stitching together frame sequences per scene and sensor.
 |
 """
 
+import functools
+import importlib.machinery
+import itertools
+import json
+import logging
+import multiprocessing
 import os
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 import math
-from statistics import median
 from datetime import datetime
 
+import numpy as np
+
 import fiftyone as fo
+from fiftyone import ViewField as F
 import fiftyone.operators as foo
 import fiftyone.operators.types as types
 
 
+logger = logging.getLogger(__name__)
+
+
 # ------------------------------
 # Frame extraction
 # ------------------------------
-def get_frame_paths(scene_view, use_generated=False, target_sensors=None, dataset=None):
+def get_frame_paths(
+    scene_view,
+    use_generated=False,
+    target_sensors=None,
+    dataset=None,
+    columns=None,
+    camera_sensors=None,
+):
     """
     Extract frame paths from a scene for specified camera sensors without
     mutating global state (no group_slice changes).
@@ -34,53 +59,75 @@ def get_frame_paths(scene_view, use_generated=False, target_sensors=None, datase
         use_generated (bool): Whether to prefer generated images if flagged
         target_sensors (list[str] | None): Subset of sensors to include
         dataset: Original dataset to get group_media_types from
+        columns (dict | None): Already-fetched ``scene_view.values()`` lists
+            keyed by field; must include ``group.name`` and ``filepath``, plus
+            ``generated`` when ``use_generated`` is set. Queried from
+            ``scene_view`` if omitted
+        camera_sensors (list[str] | None): Camera slices to extract, already
+            filtered by ``target_sensors``; derived from the media types
+            (and ``target_sensors``) if omitted
 
     Returns:
         dict[str, list[str]]: {sensor_name: [frame_filepaths]}
     """
-    # Discover sensors in this scene; keep camera slices only
-    # Use dataset group_media_types if scene_view doesn't have it
-    if dataset is not None:
-        scene_sensors = dataset.group_media_types
-    else:
-        scene_sensors = getattr(scene_view, "group_media_types", {})
-        if scene_sensors is None:
-            scene_sensors = {}
-    
-    camera_sensors = [n for n, t in scene_sensors.items() if t == "image"]
-
-    if target_sensors:
-        camera_sensors = [s for s in camera_sensors if s in target_sensors]
-        print(f"  - Filtering to target sensors: {camera_sensors}")
+    if camera_sensors is None:
+        # Discover sensors in this scene; keep camera slices only
+        # Use dataset group_media_types if scene_view doesn't have it
+        if dataset is not None:
+            scene_sensors = dataset.group_media_types
+        else:
+            scene_sensors = getattr(scene_view, "group_media_types", {})
+            if scene_sensors is None:
+                scene_sensors = {}
+
+        camera_sensors = [n for n, t in scene_sensors.items() if t == "image"]
+
+        if target_sensors:
+            camera_sensors = [s for s in camera_sensors if s in target_sensors]
+            logger.debug("  - Filtering to target sensors: %s", camera_sensors)
+
+    # If you actually store generated frames in a different field,
+    # switch `fp_field` here (e.g., "generated_filepath")
+    fp_field = "filepath"
+
+    # Single projection for the whole scene, bucketed by slice in Python.
+    # values() already $projects just the requested paths server-side, so a
+    # select_fields() stage would not shrink what comes over the wire.
+    # The generated flag is only read (and projected) when it matters
+    if columns is None:
+        fields = ["group.name", fp_field] + (["generated"] if use_generated else [])
+        columns = dict(zip(fields, scene_view.values(fields, _allow_missing=True)))
+    # One pass over the columns; non-camera slices (point clouds, etc.) are
+    # dropped while bucketing. The generated flag is kept from each sensor's
+    # first frame
+    wanted = set(camera_sensors)
+    paths_by_sensor = {}
+    generated_by_sensor = {}
+    generated_column = columns["generated"] if use_generated else itertools.repeat(False)
+    for sname, filepath, generated in zip(columns["group.name"], columns[fp_field], generated_column):
+        if sname in wanted:
+            paths_by_sensor.setdefault(sname, []).append(filepath)
+            generated_by_sensor.setdefault(sname, bool(generated))
 
     frames_dict = {}
 
     for sensor_name in camera_sensors:
-        print(f"  - Processing sensor: {sensor_name}")
-        # Filter samples by group name directly since scene_view doesn't have groups
-        sensor_samples = [s for s in scene_view if hasattr(s, 'group') and s.group and s.group.name == sensor_name]
+        logger.debug("  - Processing sensor: %s", sensor_name)
+        frame_paths = paths_by_sensor.get(sensor_name)
 
-        if not sensor_samples:
-            print(f"    No samples found for {sensor_name}")
+        if not frame_paths:
+            logger.debug("    No samples found for %s", sensor_name)
             continue
-            
-        first = sensor_samples[0]
-        # If you actually store generated frames in a different field,
-        # switch `fp_field` here (e.g., "generated_filepath")
-        use_gen_flag = ("generated" in first.field_names) and bool(first["generated"])
-        using_generated = use_generated and use_gen_flag
-        fp_field = "filepath"  # change here if you keep generated in a different field
-
-        frame_paths = [s[fp_field] for s in sensor_samples]
-
-        if frame_paths:
-            frames_dict[sensor_name] = frame_paths
-            print(
-                f"    Found {len(frame_paths)} frames for {sensor_name} "
-                f"({'generated' if using_generated else 'original'})"
-            )
-        else:
-            print(f"    No frames found for {sensor_name}")
+
+        using_generated = generated_by_sensor.get(sensor_name, False)
+
+        frames_dict[sensor_name] = frame_paths
+        logger.debug(
+            "    Found %d frames for %s (%s)",
+            len(frame_paths),
+            sensor_name,
+            "generated" if using_generated else "original",
+        )
 
     return frames_dict
 
@@ -93,144 +140,617 @@ def calculate_fps_from_timestamps(
     timestamp_field="timestamp",
     timestamps_in_seconds=None,  # None=auto-detect, True=seconds, False=microseconds
     default_fps=30.0,
-    trim_percent=0.10,           # trim 10% of extremes
+    trim_percent=0.10,           # no effect; kept for compatibility
 ):
     """
     Calculate FPS from per-frame timestamps.
 
     Args:
-        samples: Iterable of FiftyOne samples (frames)
+        samples: Iterable of FiftyOne samples (frames), or a view/dataset, in
+            which case only ``timestamp_field`` is projected from the database
         timestamp_field: Field name (guaranteed to exist on each sample)
         timestamps_in_seconds: None=auto, True=seconds, False=microseconds
         default_fps: Fallback FPS
-        trim_percent: Fraction (0..0.49) to trim from each tail
+        trim_percent: Kept for compatibility; has no effect. Trimming the
+            same fraction from each tail never moves the median gap
 
     Returns:
         float: Estimated FPS
     """
     try:
-        ts = []
-        for s in samples:
-            v = s[timestamp_field]  # direct access; field guaranteed
-            if isinstance(v, datetime):
-                v = v.timestamp()  # seconds
-            v = float(v)
-            ts.append(v)
-
-        if len(ts) < 2:
+        if isinstance(samples, fo.core.collections.SampleCollection):
+            values = samples.values(timestamp_field)
+        else:
+            values = [s[timestamp_field] for s in samples]  # direct access; field guaranteed
+    except Exception as e:
+        logger.warning("⚠️ Failed to calculate FPS from timestamps: %s", e)
+        return default_fps
+
+    return calculate_fps_from_timestamp_values(
+        values,
+        timestamps_in_seconds=timestamps_in_seconds,
+        default_fps=default_fps,
+        trim_percent=trim_percent,
+    )
+
+
+def calculate_fps_from_timestamp_values(
+    values,
+    timestamps_in_seconds=None,  # None=auto-detect, True=seconds, False=microseconds
+    default_fps=30.0,
+    trim_percent=0.10,           # no effect; kept for compatibility
+):
+    """
+    Calculate FPS from raw timestamp values, e.g. from ``view.values(field)``.
+
+    Args:
+        values: Iterable of numeric or datetime timestamps
+        timestamps_in_seconds: None=auto, True=seconds, False=microseconds
+        default_fps: Fallback FPS
+        trim_percent: Kept for compatibility; has no effect. Trimming the
+            same fraction from each tail never moves the median gap
+
+    Returns:
+        float: Estimated FPS
+    """
+    try:
+        ts = np.fromiter(
+            (v.timestamp() if isinstance(v, datetime) else float(v) for v in values),
+            dtype=np.float64,
+        )
+
+        if ts.size < 2:
             return default_fps
 
-        ts.sort()
-        diffs = [b - a for a, b in zip(ts, ts[1:]) if (b - a) > 0]
-        if not diffs:
+        diffs = np.diff(np.sort(ts))
+        diffs = diffs[diffs > 0]
+        if not diffs.size:
             return default_fps
 
+        # One O(n) median serves both unit detection and the gap: scaling
+        # doesn't move the median, and neither does trimming the same
+        # number of values from each tail
+        med = float(np.median(diffs))
+
         # Unit detection if unspecified
         # - seconds: median diff < 1
         # - milliseconds: 1 <= median diff < 1000
         # - microseconds: median diff >= 1000
         if timestamps_in_seconds is None:
-            med = median(diffs)
             if med < 1.0:
-                units = "seconds"
-                diffs_sec = diffs
+                units, scale = "seconds", 1.0
             elif med < 1000.0:
-                units = "milliseconds"
-                diffs_sec = [d / 1_000.0 for d in diffs]
+                units, scale = "milliseconds", 1_000.0
             else:
-                units = "microseconds"
-                diffs_sec = [d / 1_000_000.0 for d in diffs]
+                units, scale = "microseconds", 1_000_000.0
         else:
             if timestamps_in_seconds:
-                units = "seconds"
-                diffs_sec = diffs
+                units, scale = "seconds", 1.0
             else:
-                units = "microseconds"
-                diffs_sec = [d / 1_000_000.0 for d in diffs]
+                units, scale = "microseconds", 1_000_000.0
 
-        diffs_sec.sort()
-        if 0.0 < trim_percent < 0.49 and len(diffs_sec) > 10:
-            k = int(len(diffs_sec) * trim_percent)
-            diffs_sec = diffs_sec[k: len(diffs_sec) - k] or diffs_sec
-
-        gap = median(diffs_sec)
+        n = diffs.size
+        gap = med / scale
         if gap <= 0 or math.isinf(gap) or math.isnan(gap):
             return default_fps
 
         fps = 1.0 / gap
         fps = max(1.0, min(240.0, fps))
 
-        print(f"📊 Calculated FPS: {fps:.3f} (median Δ={gap:.6f}s, units={units}, n={len(diffs_sec)})")
+        logger.debug(
+            "📊 Calculated FPS: %.3f (median Δ=%.6fs, units=%s, n=%d)", fps, gap, units, n
+        )
         return fps
 
     except Exception as e:
-        print(f"⚠️ Failed to calculate FPS from timestamps: {e}")
+        logger.warning("⚠️ Failed to calculate FPS from timestamps: %s", e)
         return default_fps
 
 
 # ------------------------------
 # Video creation via ffmpeg
 # ------------------------------
-def create_video_from_frames(frame_paths, output_path, fps=30):
+# Encoder threads per ffmpeg process; kept small so parallel encodes don't
+# oversubscribe the CPU
+DEFAULT_THREADS_PER_ENCODE = 2
+
+# Inputs with these extensions are already-encoded clips and get stream-copied
+VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".avi", ".webm", ".ts", ".m4v"}
+
+# Hardware H.264 encoders in order of preference; libx264 is the fallback
+HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_vaapi")
+SOFTWARE_ENCODER = "libx264"
+
+# Encoders selectable from the operator; "auto" defers to detect_encoder()
+ENCODER_CHOICES = ("auto", "libx264", "libsvtav1", "h264_nvenc", "hevc_nvenc", "h264_videotoolbox", "h264_vaapi")
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# Consumer NVIDIA cards cap concurrent NVENC sessions, so hardware encodes
+# are throttled independently of the thread pool size. Scene worker
+# processes replace this with one semaphore shared by all of them
+MAX_HW_ENCODE_SESSIONS = 2
+_hw_encode_sessions = threading.BoundedSemaphore(MAX_HW_ENCODE_SESSIONS)
+_HW_ENCODER_SUFFIXES = ("_nvenc", "_videotoolbox", "_vaapi")
+
+# ffmpeg resolved against PATH once, rather than on every spawn
+_FFMPEG_BIN = shutil.which("ffmpeg") or "ffmpeg"
+
+# Pipe buffer size; concat lists for long scenes go to stdin in large writes
+FFMPEG_PIPE_BUFSIZE = 1 << 20
+
+# Trailing ffmpeg stderr lines kept for error reporting
+FFMPEG_LOG_LINES = 200
+
+# Quoting for concat demuxer entries: ' becomes '\''
+_CONCAT_QUOTE_TABLE = str.maketrans({"'": r"'\''"})
+
+# Trailing frame number in a filename, e.g. ".../frame_00042.jpg"
+_FRAME_NUMBER_RE = re.compile(r"^(.*?)(\d+)(\.[^./\\]+)$")
+
+
+def _default_max_workers(threads_per_encode=DEFAULT_THREADS_PER_ENCODE):
+    """Number of concurrent ffmpeg encodes that fit on this machine."""
+    return max(1, (os.cpu_count() or 1) // max(1, threads_per_encode))
+
+
+def _resolve_encode_parallelism(max_workers=None, threads_per_encode=None):
+    """
+    Fill in whichever of pool size / threads per encode was not given so that
+    together they roughly match the CPU count.
+
+    Returns:
+        tuple[int, int]: (max_workers, threads_per_encode)
+    """
+    cpus = os.cpu_count() or 1
+    if max_workers and threads_per_encode:
+        return max_workers, threads_per_encode
+    if max_workers:
+        return max_workers, max(1, cpus // max_workers)
+    if threads_per_encode:
+        return _default_max_workers(threads_per_encode), threads_per_encode
+    return _default_max_workers(), DEFAULT_THREADS_PER_ENCODE
+
+
+def _run_ffmpeg(cmd, input_text=None, max_log_lines=FFMPEG_LOG_LINES):
+    """
+    Run ffmpeg, keeping only the tail of its stderr in memory.
+
+    Args:
+        cmd: Full ffmpeg command line
+        input_text: Optional text written to ffmpeg's stdin
+        max_log_lines: Number of trailing stderr lines to keep
+
+    Returns:
+        tuple[int, str]: (return code, last stderr lines)
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=FFMPEG_PIPE_BUFSIZE,
+    )
+    log_tail = deque(maxlen=max_log_lines)
+    reader = threading.Thread(target=lambda: log_tail.extend(proc.stderr), daemon=True)
+    reader.start()
+
+    if input_text is not None:
+        try:
+            proc.stdin.write(input_text)
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its stderr says why
+        finally:
+            proc.stdin.close()
+
+    returncode = proc.wait()
+    reader.join()
+    proc.stderr.close()
+    return returncode, "".join(log_tail)
+
+
+def _encoder_works(encoder):
+    """Run a tiny synthetic encode to confirm ``encoder`` is usable here."""
+    cmd = [_FFMPEG_BIN, "-hide_banner", "-loglevel", "error"]
+    if encoder == "h264_vaapi":
+        cmd += ["-vaapi_device", VAAPI_DEVICE]
+    cmd += ["-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1"]
+    if encoder == "h264_vaapi":
+        cmd += ["-vf", "format=nv12,hwupload"]
+    cmd += ["-c:v", encoder, "-f", "null", "-"]
+    try:
+        return subprocess.run(cmd, capture_output=True).returncode == 0
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_encoders():
+    """``ffmpeg -encoders`` listing, fetched once per process ("" if unavailable)."""
+    try:
+        return subprocess.run(
+            [_FFMPEG_BIN, "-hide_banner", "-encoders"], capture_output=True, text=True
+        ).stdout
+    except OSError:
+        return ""
+
+
+def _has_encoder(name):
+    """Whether this ffmpeg build lists the ``name`` encoder."""
+    return re.search(rf"\b{re.escape(name)}\b", _ffmpeg_encoders()) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def detect_encoder():
+    """
+    Pick the H.264 encoder to use, probing ffmpeg only once per process.
+
+    ffmpeg builds often list hardware encoders without a device to back them,
+    so each candidate is verified with a short test encode.
+
+    Returns:
+        str: First working encoder from ``HW_ENCODERS``, else ``"libx264"``
+    """
+    for encoder in HW_ENCODERS:
+        if _has_encoder(encoder) and _encoder_works(encoder):
+            logger.info("Using hardware encoder: %s", encoder)
+            return encoder
+
+    return SOFTWARE_ENCODER
+
+
+def _is_hw_encoder(encoder):
+    """Whether ``encoder`` runs on a (session-limited) hardware encoder."""
+    return encoder.endswith(_HW_ENCODER_SUFFIXES)
+
+
+def _encoder_args(encoder, threads, preset=None, crf=None):
+    """
+    ffmpeg arguments for ``encoder``.
+
+    Args:
+        encoder: ffmpeg video encoder name
+        threads: Encoder threads (software encoders only)
+        preset: Encoder preset; None uses a fast per-encoder default
+        crf: Constant rate factor for libx264/libsvtav1; None uses the
+            encoder's default (23 for libx264, 35 for libsvtav1)
+
+    Returns:
+        tuple[list[str], list[str]]: (args placed before the inputs,
+        codec args placed after them)
+    """
+    if encoder in ("h264_nvenc", "hevc_nvenc"):
+        return [], ["-c:v", encoder, "-preset", preset or "p1", "-rc", "vbr", "-b:v", "5M", "-pix_fmt", "yuv420p"]
+    if encoder == "h264_videotoolbox":
+        return [], ["-c:v", encoder, "-b:v", "5M", "-pix_fmt", "yuv420p"]
+    if encoder == "h264_vaapi":
+        return ["-vaapi_device", VAAPI_DEVICE], ["-vf", "format=nv12,hwupload", "-c:v", encoder]
+    if encoder == "libsvtav1":
+        return [], [
+            "-c:v", encoder,
+            "-preset", preset or "12",
+            "-crf", str(crf or 35),
+            "-threads", str(threads),
+            "-pix_fmt", "yuv420p",
+        ]
+    if encoder != SOFTWARE_ENCODER:
+        return [], [
+            "-c:v", encoder,
+            *(["-preset", preset] if preset else []),
+            "-threads", str(threads),
+            "-pix_fmt", "yuv420p",
+        ]
+    return [], [
+        "-c:v", encoder,
+        "-preset", preset or "ultrafast",
+        "-tune", "stillimage",
+        *(["-crf", str(crf)] if crf else []),
+        "-threads", str(threads),
+        "-pix_fmt", "yuv420p",
+    ]
+
+
+def _detect_numeric_pattern(frame_paths):
+    """
+    Detect frames named ``<prefix><number><suffix>`` with consecutive numbers.
+
+    Args:
+        frame_paths: List of frame paths in playback order
+
+    Returns:
+        tuple[str, int] | None: (image2 pattern such as ``dir/frame_%05d.jpg``,
+        start number), or None if the frames are not a contiguous sequence
+    """
+    first = _FRAME_NUMBER_RE.match(str(frame_paths[0]))
+    if first is None:
+        return None
+
+    prefix, digits, suffix = first.groups()
+    width = len(digits)
+    expected = int(digits)
+    for frame_path in frame_paths:
+        m = _FRAME_NUMBER_RE.match(str(frame_path))
+        if (
+            m is None
+            or m.group(1) != prefix
+            or m.group(3) != suffix
+            or len(m.group(2)) != width
+            or int(m.group(2)) != expected
+        ):
+            return None
+        expected += 1
+
+    # Literal '%' in the path must be doubled for the image2 demuxer
+    pattern = f"{prefix.replace('%', '%%')}%0{width}d{suffix.replace('%', '%%')}"
+    return pattern, int(digits)
+
+
+def _is_video_path(path):
+    return os.path.splitext(str(path))[1].lower() in VIDEO_EXTENSIONS
+
+
+def _as_sequence(frame_paths):
+    """``frame_paths`` as an indexable sequence, copying only if it isn't one."""
+    return frame_paths if isinstance(frame_paths, (list, tuple)) else list(frame_paths)
+
+
+def _concat_list(frame_paths):
+    """
+    Concat demuxer list for ``frame_paths``, built in one join; escapes single quotes.
+
+    Entries are absolute ``file:`` URLs. ffmpeg resolves bare entries relative
+    to the list's own URL, which fails when the list is read from ``pipe:0``.
+    """
+    return "".join(
+        "file 'file:" + (path if "'" not in path else path.translate(_CONCAT_QUOTE_TABLE)) + "'\n"
+        for path in map(os.path.abspath, map(str, frame_paths))
+    )
+
+
+def _image_input_args(frame_paths, fps, concat_source="pipe:0"):
+    """
+    ffmpeg arguments that read an image sequence at ``fps``.
+
+    Contiguous numbered frames are read by the image2 demuxer directly;
+    otherwise a concat list is used, which the caller must serve at
+    ``concat_source`` (stdin by default, or a file path).
+
+    Returns:
+        tuple[list[str], list[str], str | None]: (input args ending with the
+        ``-i`` option, output args for the matching output, concat list text
+        or None if no list is needed)
+    """
+    pattern = _detect_numeric_pattern(frame_paths)
+    if pattern is not None:
+        pattern_path, start_number = pattern
+        input_args = [
+            "-framerate", str(fps),
+            "-start_number", str(start_number),
+            "-i", pattern_path,
+        ]
+        return input_args, ["-frames:v", str(len(frame_paths))], None
+
+    # -r before -i controls input frame rate for image sequences when using concat list
+    input_args = [
+        "-r", str(fps),
+        "-f", "concat",
+        "-safe", "0",
+        "-protocol_whitelist", "pipe,file",
+        "-i", concat_source,
+    ]
+    return input_args, ["-vsync", "vfr"], _concat_list(frame_paths)
+
+
+def create_video_from_frames(
+    frame_paths,
+    output_path,
+    fps=30,
+    threads=0,
+    encoder=None,
+    preset=None,
+    crf=None,
+):
     """
     Create a video from a sequence of frame images using ffmpeg.
 
+    If the inputs are video clips rather than images (see ``VIDEO_EXTENSIONS``)
+    they are concatenated with ``-c copy`` instead of being re-encoded; this
+    assumes the clips share a codec. Contiguously numbered image frames are
+    read with the image2 demuxer; anything else goes through a concat list.
+
     Args:
-        frame_paths: List of paths to frame images (sorted)
+        frame_paths: Paths to frame images or video clips, used in the given
+            order (never re-sorted here; scenes arrive ordered by timestamp
+            from the database)
         output_path: Path where the output video will be saved
         fps: Frames per second for the output video
+        threads: ffmpeg encoder threads; the default 0 lets ffmpeg pick
+            (all cores). Callers running several encodes at once should
+            pass their share, as ``_process_scene`` does
+        encoder: ffmpeg video encoder; None picks one via ``detect_encoder()``.
+            A failed encode with anything but libx264 is retried once with
+            libx264 at its default settings
+        preset: Encoder preset (see ``_encoder_args``); None for the default
+        crf: Constant rate factor for software encoders; None for the default
 
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        frame_paths = list(frame_paths)
+        frame_paths = _as_sequence(frame_paths)
         if not frame_paths:
-            print("FFmpeg: no frame paths")
+            logger.warning("FFmpeg: no frame paths")
             return False
 
         out_dir = os.path.dirname(output_path) or "."
         os.makedirs(out_dir, exist_ok=True)
 
-        # Concat demuxer list; escape single quotes
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            for frame_path in frame_paths:
-                sp = str(frame_path).replace("'", r"'\''")
-                f.write(f"file '{sp}'\n")
-            filelist_path = f.name
-
-        # -r before -i controls input frame rate for image sequences when using concat list
-        cmd = [
-            "ffmpeg",
-            "-hide_banner", "-loglevel", "error",
-            "-r", str(fps),
-            "-f", "concat",
-            "-safe", "0",
-            "-i", filelist_path,
-            "-vsync", "vfr",
-            "-c:v", "libx264",
-            "-pix_fmt", "yuv420p",
-            "-movflags", "+faststart",
-            "-y",
-            output_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        os.unlink(filelist_path)
+        inputs_are_video = _is_video_path(frame_paths[0])
+        if inputs_are_video:
+            # Concat demuxer list, fed to ffmpeg on stdin
+            concat_list = _concat_list(frame_paths)
+            input_args = [
+                "-f", "concat",
+                "-safe", "0",
+                "-protocol_whitelist", "pipe,file",
+                "-i", "pipe:0",
+            ]
+            output_args = []
+        else:
+            input_args, output_args, concat_list = _image_input_args(frame_paths, fps)
 
-        if result.returncode != 0:
-            print("FFmpeg error:", (result.stderr or "").strip())
+        def run_ffmpeg(encoder, preset=None, crf=None):
+            if inputs_are_video:
+                # Pre-encoded chunks: stream copy, no decode/encode
+                device_args, codec_args = [], ["-c", "copy"]
+            else:
+                device_args, codec_args = _encoder_args(encoder, threads, preset=preset, crf=crf)
+
+            cmd = [
+                _FFMPEG_BIN,
+                "-hide_banner", "-loglevel", "error",
+                *device_args,
+                *input_args,
+                *output_args,
+                *codec_args,
+                "-movflags", "+faststart",
+                "-y",
+                output_path,
+            ]
+            if _is_hw_encoder(encoder) and not inputs_are_video:
+                with _hw_encode_sessions:
+                    return _run_ffmpeg(cmd, input_text=concat_list)
+            return _run_ffmpeg(cmd, input_text=concat_list)
+
+        if encoder is None:
+            encoder = detect_encoder()
+
+        returncode, log_tail = run_ffmpeg(encoder, preset=preset, crf=crf)
+        if returncode != 0 and encoder != SOFTWARE_ENCODER and not inputs_are_video:
+            logger.warning("FFmpeg: %s failed, retrying with %s", encoder, SOFTWARE_ENCODER)
+            returncode, log_tail = run_ffmpeg(SOFTWARE_ENCODER)
+
+        if returncode != 0:
+            logger.error("FFmpeg error: %s", log_tail.strip())
             return False
 
         return True
 
     except Exception as e:
-        print(f"Error creating video from frames: {e}")
+        logger.error("Error creating video from frames: %s", e)
         return False
 
 
+def _can_fuse_encodes(jobs, encoder):
+    """
+    Whether ``jobs`` (``(frame_paths, output_path, fps)`` tuples) can share one
+    ffmpeg process in ``create_videos_from_frame_sets``: more than one job,
+    a software encoder, and image (not video-clip) inputs only.
+    """
+    if encoder is None:
+        encoder = detect_encoder()
+    return (
+        len(jobs) > 1
+        and not _is_hw_encoder(encoder)
+        and all(frame_paths and not _is_video_path(frame_paths[0]) for frame_paths, _, _ in jobs)
+    )
+
+
+def create_videos_from_frame_sets(
+    jobs, threads=DEFAULT_THREADS_PER_ENCODE, encoder=None, preset=None, crf=None
+):
+    """
+    Encode several image sequences with a single ffmpeg process.
+
+    Each job becomes one input and one mapped output, so ffmpeg decodes and
+    encodes the streams side by side instead of in K separate processes.
+    Video-clip inputs, hardware encoders (whose session count is limited)
+    and single jobs go through ``create_video_from_frames`` one by one, as
+    does every job if the fused run fails.
+
+    Args:
+        jobs: List of ``(frame_paths, output_path, fps)`` tuples; frames are
+            used in the given order
+        threads: ffmpeg encoder threads per output
+        encoder: ffmpeg video encoder; None picks one via ``detect_encoder()``
+        preset: Encoder preset (see ``_encoder_args``); None for the default
+        crf: Constant rate factor for software encoders; None for the default
+
+    Returns:
+        list[bool]: Success flag per job, in order
+    """
+    if encoder is None:
+        encoder = detect_encoder()
+
+    jobs = [(_as_sequence(frame_paths), output_path, fps) for frame_paths, output_path, fps in jobs]
+    if not _can_fuse_encodes(jobs, encoder):
+        return [
+            create_video_from_frames(
+                frame_paths, output_path, fps=fps, threads=threads, encoder=encoder, preset=preset, crf=crf
+            )
+            for frame_paths, output_path, fps in jobs
+        ]
+
+    list_paths = []
+    try:
+        input_args = []
+        output_args = []
+        for index, (frame_paths, output_path, fps) in enumerate(jobs):
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+            # Only one input can use stdin, so concat lists go to temp files
+            # (written through mkstemp's descriptor in one call, no reopen)
+            fd, list_path = tempfile.mkstemp(suffix=".txt")
+            list_paths.append(list_path)
+            with os.fdopen(fd, "w") as f:
+                job_input_args, job_output_args, concat_list = _image_input_args(
+                    frame_paths, fps, concat_source=list_path
+                )
+                if concat_list is not None:
+                    f.write(concat_list)
+
+            _, codec_args = _encoder_args(encoder, threads, preset=preset, crf=crf)
+            input_args += job_input_args
+            output_args += [
+                "-map", f"{index}:v",
+                *job_output_args,
+                *codec_args,
+                "-movflags", "+faststart",
+                output_path,
+            ]
+
+        cmd = [_FFMPEG_BIN, "-hide_banner", "-loglevel", "error", "-y", *input_args, *output_args]
+        returncode, log_tail = _run_ffmpeg(cmd)
+    except Exception as e:
+        returncode, log_tail = None, str(e)
+    finally:
+        for list_path in list_paths:
+            try:
+                os.unlink(list_path)
+            except OSError:
+                pass
+
+    if returncode == 0:
+        return [True] * len(jobs)
+
+    logger.warning("FFmpeg: fused encode of %d outputs failed (%s); encoding separately", len(jobs), log_tail.strip())
+    return [
+        create_video_from_frames(
+            frame_paths, output_path, fps=fps, threads=threads, encoder=encoder, preset=preset, crf=crf
+        )
+        for frame_paths, output_path, fps in jobs
+    ]
+
+
 # ------------------------------
 # Operator
 # ------------------------------
+@functools.lru_cache(maxsize=16)
+def _schema_choices(dataset_name, field_names):
+    """Autocomplete choices for ``field_names``, built once per schema."""
+    return [types.Choice(label=field_name, value=field_name) for field_name in field_names]
+
+
 class CreateVideoAssetsPerScene(foo.Operator):
     """
     Create video assets from grouped datasets by stitching together frame sequences per scene and sensor.
@@ -258,11 +778,12 @@ class CreateVideoAssetsPerScene(foo.Operator):
     def resolve_input(self, ctx):
         inputs = types.Object()
 
-        # Build simple field choices for autocomplete (schema keys only)
+        # Build simple field choices for autocomplete (schema keys only);
+        # one shared list per schema, reused by every field input below
         dataset_field_choices = []
         if getattr(ctx, "dataset", None) is not None:
-            schema = ctx.dataset.get_field_schema()
-            dataset_field_choices = [types.Choice(label=field_name, value=field_name) for field_name in schema.keys()]
+            field_names = tuple(ctx.dataset.get_field_schema().keys())
+            dataset_field_choices = _schema_choices(ctx.dataset.name, field_names)
 
         # Scene ID field
         inputs.str(
@@ -332,6 +853,67 @@ class CreateVideoAssetsPerScene(foo.Operator):
             view=types.AutocompleteView(choices=dataset_field_choices),
         )
 
+        # Parallel encodes
+        inputs.int(
+            "max_workers",
+            label="Max Parallel Encodes",
+            description="Number of ffmpeg encodes to run concurrently (0 = auto from CPU count)",
+            default=0,
+            min=0,
+        )
+
+        inputs.int(
+            "threads_per_encode",
+            label="Threads Per Encode",
+            description="ffmpeg encoder threads per video (0 = CPU count / parallel encodes)",
+            default=0,
+            min=0,
+        )
+
+        # Parallel scenes
+        inputs.int(
+            "scene_workers",
+            label="Scene Worker Processes",
+            description=(
+                "Number of scenes to process concurrently in separate processes "
+                f"(0 = auto, up to {MAX_AUTO_SCENE_WORKERS}; 1 = in-process)"
+            ),
+            default=1,
+            min=0,
+        )
+
+        # Fused multi-sensor encodes
+        inputs.bool(
+            "fuse_sensor_encodes",
+            label="Fuse Sensor Encodes",
+            description="Encode all sensors of a scene with a single ffmpeg process",
+            default=False,
+        )
+
+        # Encoder settings
+        inputs.enum(
+            "encoder",
+            list(ENCODER_CHOICES),
+            label="Encoder",
+            description="ffmpeg video encoder ('auto' = first working hardware encoder, else libx264)",
+            default="auto",
+            view=types.DropdownView(),
+        )
+        inputs.str(
+            "encoder_preset",
+            label="Encoder Preset",
+            description="Encoder preset, e.g. 'veryfast' or 'p1' (empty = fast default for the encoder)",
+            default="",
+        )
+        inputs.int(
+            "crf",
+            label="CRF",
+            description="Constant rate factor for libx264/libsvtav1 (0 = encoder default)",
+            default=0,
+            min=0,
+            max=63,
+        )
+
         return types.Property(inputs)
 
     def execute(self, ctx):
@@ -345,19 +927,32 @@ class CreateVideoAssetsPerScene(foo.Operator):
         use_generated = ctx.params.get("use_generated", False)
         target_sensors = ctx.params.get("target_sensors", []) or None
         video_path_field = ctx.params.get("video_path_field", "video_path")
+        max_workers = ctx.params.get("max_workers", 0) or None
+        threads_per_encode = ctx.params.get("threads_per_encode", 0) or None
+        scene_workers = ctx.params.get("scene_workers", 1)
+        fuse_sensor_encodes = ctx.params.get("fuse_sensor_encodes", False)
+        encoder = ctx.params.get("encoder", "auto")
+        encoder = None if encoder in (None, "", "auto") else encoder
+        encoder_preset = ctx.params.get("encoder_preset", "") or None
+        crf = ctx.params.get("crf", 0) or None
 
         dataset = ctx.dataset
         if dataset is None:
             raise ValueError("No dataset found in context")
 
-        print(f"Processing dataset: {dataset.name}")
-        print(f"Scene ID field: {scene_id_field}")
-        print(f"Timestamp field: {timestamp_field}")
-        print(f"FPS override: {use_fps_override} ({fps} if True)")
-        print(f"Timestamps units: {'seconds' if timestamps_in_seconds else 'microseconds'}")
-        print(f"Use generated: {use_generated}")
-        print(f"Target sensors: {target_sensors}")
-        print(f"Video path field: {video_path_field}")
+        logger.info("Processing dataset: %s", dataset.name)
+        logger.info("Scene ID field: %s", scene_id_field)
+        logger.info("Timestamp field: %s", timestamp_field)
+        logger.info("FPS override: %s (%s if True)", use_fps_override, fps)
+        logger.info("Timestamps units: %s", "seconds" if timestamps_in_seconds else "microseconds")
+        logger.info("Use generated: %s", use_generated)
+        logger.info("Target sensors: %s", target_sensors)
+        logger.info("Video path field: %s", video_path_field)
+        logger.info("Max parallel encodes: %s", max_workers or "auto")
+        logger.info("Threads per encode: %s", threads_per_encode or "auto")
+        logger.info("Scene worker processes: %s", scene_workers or "auto")
+        logger.info("Fuse sensor encodes: %s", fuse_sensor_encodes)
+        logger.info("Encoder: %s (preset %s, crf %s)", encoder or "auto", encoder_preset or "default", crf or "default")
 
         results = _process_grouped_dataset(
             dataset=dataset,
@@ -369,11 +964,417 @@ class CreateVideoAssetsPerScene(foo.Operator):
             use_generated=use_generated,
             target_sensors=target_sensors,
             video_path_field=video_path_field,
+            max_workers=max_workers,
+            threads_per_encode=threads_per_encode,
+            scene_workers=scene_workers,
+            fuse_sensor_encodes=fuse_sensor_encodes,
+            encoder=encoder,
+            encoder_preset=encoder_preset,
+            crf=crf,
         )
 
         return results
 
 
+# ------------------------------
+# Existing video lookup
+# ------------------------------
+def _list_videos(directory, cache):
+    """
+    Names of the ``.mp4`` files in ``directory``, scanned once per run.
+
+    Args:
+        directory: Directory to list
+        cache: dict of previous results, keyed by directory
+
+    Returns:
+        set[str]: File names (not paths)
+    """
+    if directory not in cache:
+        try:
+            with os.scandir(directory) as entries:
+                cache[directory] = {e.name for e in entries if e.name.endswith(".mp4")}
+        except OSError:
+            cache[directory] = set()
+    return cache[directory]
+
+
+# ------------------------------
+# Run manifest
+# ------------------------------
+# Per-dataset record of videos already written, so reruns can reuse finished
+# videos without re-encoding or re-listing them. reset_videos.py clears it.
+MANIFEST_DIR = os.path.join(os.path.expanduser("~"), ".cache", "fiftyone_video_creator")
+
+
+# The manifest is rewritten after this many recorded scenes or seconds,
+# whichever comes first, and once more when the run ends
+MANIFEST_SAVE_EVERY = 32
+MANIFEST_SAVE_INTERVAL = 30.0
+
+
+def _manifest_path(dataset_name):
+    return os.path.join(MANIFEST_DIR, f"{dataset_name}.json")
+
+
+def _load_manifest(dataset_name):
+    """
+    Load the manifest for a dataset.
+
+    Returns:
+        dict: ``{"<scene_id_field>/<video_path_field>": {scene_id: {sensor:
+        {"video_path": str, "mtime": float} | None}}}``, empty if missing
+    """
+    try:
+        with open(_manifest_path(dataset_name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(dataset_name, manifest):
+    """Atomically rewrite the manifest for a dataset."""
+    path = _manifest_path(dataset_name)
+    try:
+        os.makedirs(MANIFEST_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("⚠️ Could not write manifest %s: %s", path, e)
+
+
+def clear_manifest(dataset_name, video_path_field):
+    """
+    Drop a dataset's manifest entries for a video field so the next run
+    re-checks every scene. Used by ``reset_videos.py``.
+
+    Returns:
+        bool: True if any entries were removed
+    """
+    manifest = _load_manifest(dataset_name)
+    keys = [k for k in manifest if k.endswith(f"/{video_path_field}")]
+    if not keys:
+        return False
+
+    for key in keys:
+        del manifest[key]
+    _save_manifest(dataset_name, manifest)
+    return True
+
+
+def _file_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+
+def _manifest_covers(entry, sensors):
+    """
+    Whether a scene's manifest entry accounts for every sensor in ``sensors``.
+
+    A sensor is covered if it was absent from the scene (recorded as None) or
+    its video still exists with the recorded mtime and its first frame (when
+    recorded) has not changed since the video was made.
+    """
+    for sensor in sensors:
+        if sensor not in entry:
+            return False
+        record = entry[sensor]
+        if record is None:
+            continue
+        if _file_mtime(record["video_path"]) != record["mtime"]:
+            return False
+        if "first_frame" in record and _file_mtime(record["first_frame"]) != record["first_frame_mtime"]:
+            return False
+    return True
+
+
+# ------------------------------
+# Scene processing
+# ------------------------------
+def _process_scene(
+    scene_view,
+    scene_id,
+    dataset,
+    executor,
+    dir_videos_cache,
+    timestamp_field="timestamp",
+    fps=None,
+    use_fps_override=False,
+    timestamps_in_seconds=False,
+    use_generated=False,
+    target_sensors=None,
+    video_path_field="video_path",
+    fuse_sensor_encodes=False,
+    threads_per_encode=DEFAULT_THREADS_PER_ENCODE,
+    encoder=None,
+    encoder_preset=None,
+    crf=None,
+    camera_sensors=None,
+    known_videos=None,
+):
+    """
+    Create the missing videos for one scene and write their paths back.
+
+    Args:
+        scene_view: View of the scene's samples, ordered by timestamp
+        scene_id: Value of the scene ID field for this scene
+        dataset: Dataset the scene belongs to
+        executor: Executor that runs the encode jobs
+        dir_videos_cache: Cache passed to ``_list_videos``
+        fuse_sensor_encodes: Encode all of the scene's sensors in one ffmpeg
+            process (``create_videos_from_frame_sets``) instead of one each
+        threads_per_encode: ffmpeg encoder threads per video
+        encoder, encoder_preset, crf: Passed to ``create_video_from_frames``
+            as ``encoder``, ``preset`` and ``crf``
+        camera_sensors: Camera slices to process, resolved once per run
+            (see ``get_frame_paths``)
+        known_videos: ``{sensor: manifest record}`` the run manifest
+            vouches for. A record is only honored if its ``first_frame`` is
+            still this scene's first frame for the sensor; those videos are
+            not re-encoded or looked up on disk, but their paths are still
+            written back
+
+    Returns:
+        dict: ``videos_created``, ``samples_updated``,
+        ``sensor_video_paths`` ({sensor: video path}) and
+        ``frame_sensors`` ({sensor: first frame path} for the sensors that
+        had frames in this scene)
+    """
+    result = {
+        "videos_created": 0,
+        "samples_updated": 0,
+        "sensor_video_paths": {},
+        "frame_sensors": {},
+    }
+
+    # One projection of everything this scene needs; reused for
+    # frame paths, existing-video checks, FPS and the write-back
+    fields = ["id", "group.name", "filepath", timestamp_field, video_path_field]
+    if use_generated:
+        fields.append("generated")
+    columns = dict(zip(fields, scene_view.values(fields, _allow_missing=True)))
+    sample_ids = columns["id"]
+    slice_names = columns["group.name"]
+
+    # Extract per-sensor frame sequences
+    logger.debug("  - Extracting frame paths:")
+    frame_sequences = get_frame_paths(
+        scene_view,
+        use_generated=use_generated,
+        target_sensors=target_sensors,
+        dataset=dataset,
+        columns=columns,
+        camera_sensors=camera_sensors,
+    )
+    if not frame_sequences:
+        logger.info("  - No frame sequences found for scene %s; skipping", scene_id)
+        return result
+
+    result["frame_sensors"] = {
+        sensor_name: frame_paths[0] for sensor_name, frame_paths in frame_sequences.items() if frame_paths
+    }
+    sensor_video_paths = result["sensor_video_paths"]
+    encode_jobs = {}
+
+    existing_by_sensor = {}
+    timestamps_by_sensor = {}
+    for sname, existing, ts in zip(slice_names, columns[video_path_field], columns[timestamp_field]):
+        if sname not in frame_sequences:
+            continue
+        existing_by_sensor.setdefault(sname, []).append(existing)
+        timestamps_by_sensor.setdefault(sname, []).append(ts)
+
+    # Output path per sensor (next to its first frame), built once and
+    # shared by the on-disk check and the encode step
+    known_videos = known_videos or {}
+    output_paths = {}
+    on_disk = set()
+    for sensor_name, frame_paths in frame_sequences.items():
+        if not frame_paths:
+            continue
+        # Only trust a manifest record made from these very frames
+        record = known_videos.get(sensor_name)
+        if record is not None and record.get("first_frame") == frame_paths[0]:
+            output_paths[sensor_name] = record["video_path"]
+            on_disk.add(sensor_name)
+            continue
+        first_frame_dir = os.path.dirname(frame_paths[0])
+        video_name = f"scene_{scene_id}_{sensor_name}_generated.mp4"
+        output_paths[sensor_name] = os.path.join(first_frame_dir, video_name)
+        if video_name in _list_videos(first_frame_dir, dir_videos_cache):
+            on_disk.add(sensor_name)
+
+    # Per-sensor processing
+    for sensor_name, frame_paths in frame_sequences.items():
+        if sensor_name not in output_paths:
+            continue
+
+        sensor_existing = existing_by_sensor.get(sensor_name)
+        if not sensor_existing:
+            continue
+
+        # (a) Field-level: already annotated with a video path?
+        if all(sensor_existing):
+            # Use the first path (assume uniform)
+            existing = sensor_existing[0]
+            logger.info("  - %s: video already set in fields → %s", sensor_name, existing)
+            sensor_video_paths[sensor_name] = existing
+            continue
+
+        # (b) On-disk check
+        video_output_path = output_paths[sensor_name]
+        if sensor_name in on_disk:
+            logger.info("  - %s: found existing on disk → %s", sensor_name, video_output_path)
+            sensor_video_paths[sensor_name] = video_output_path
+            continue
+
+        # FPS
+        if use_fps_override and fps is not None:
+            video_fps = fps
+        else:
+            video_fps = calculate_fps_from_timestamp_values(
+                timestamps_by_sensor[sensor_name], timestamps_in_seconds
+            )
+
+        logger.info("  - %s: creating video @ %.3f fps → %s", sensor_name, video_fps, video_output_path)
+        encode_jobs[sensor_name] = (frame_paths, video_output_path, video_fps)
+
+    # Fusing is decided here: jobs that can't share an ffmpeg process
+    # (hardware encoder, clip inputs, a single job) still get one future
+    # each instead of running one after another in a single future
+    if fuse_sensor_encodes and _can_fuse_encodes(list(encode_jobs.values()), encoder):
+        # All of this scene's sensors in one ffmpeg process
+        fused = executor.submit(
+            create_videos_from_frame_sets,
+            list(encode_jobs.values()),
+            threads=threads_per_encode,
+            encoder=encoder,
+            preset=encoder_preset,
+            crf=crf,
+        )
+        outcomes = dict(zip(encode_jobs, fused.result()))
+    else:
+        futures = {
+            executor.submit(
+                create_video_from_frames,
+                frame_paths,
+                video_output_path,
+                fps=video_fps,
+                threads=threads_per_encode,
+                encoder=encoder,
+                preset=encoder_preset,
+                crf=crf,
+            ): sensor_name
+            for sensor_name, (frame_paths, video_output_path, video_fps) in encode_jobs.items()
+        }
+        outcomes = {futures[future]: future.result() for future in as_completed(futures)}
+
+    # This scene's encodes are done; record them before writing fields back
+    for sensor_name, (_, video_output_path, _) in encode_jobs.items():
+        if outcomes[sensor_name]:
+            sensor_video_paths[sensor_name] = video_output_path
+            result["videos_created"] += 1
+            logger.info("    ✓ Created %s", video_output_path)
+        else:
+            logger.warning("    ✗ Failed to create video for %s", sensor_name)
+
+    # Write field back for produced sensors in a single bulk update,
+    # leaving out samples that already hold the right path
+    updates = {
+        sample_id: sensor_video_paths[sname]
+        for sample_id, sname, existing in zip(sample_ids, slice_names, columns[video_path_field])
+        if sname in sensor_video_paths and existing != sensor_video_paths[sname]
+    }
+    if updates:
+        scene_view.set_values(video_path_field, updates, key_field="id")
+    result["samples_updated"] = len(updates)
+
+    logger.info("  - Updated %s for %d samples in scene %s", video_path_field, len(updates), scene_id)
+    return result
+
+
+# ------------------------------
+# Scene worker processes
+# ------------------------------
+# Upper bound for scene_workers=0 (auto); each worker holds its own
+# database connection
+MAX_AUTO_SCENE_WORKERS = 4
+
+# Per-process state for scene workers, set up by _init_scene_worker()
+_worker_state = {}
+
+
+def _scene_workers_supported():
+    """
+    Whether spawned worker processes can re-import this module by name.
+
+    That holds when the plugin is importable from ``sys.path``; otherwise
+    scenes are processed in-process. ``sys.modules`` is deliberately not
+    consulted: FiftyOne loads plugins by file path and registers them there,
+    but a fresh worker process could not import them.
+    """
+    if "." in __name__:
+        return False
+    try:
+        spec = importlib.machinery.PathFinder.find_spec(__name__)
+    except (ImportError, ValueError):
+        return False
+    if spec is None or spec.origin is None:
+        return False
+    try:
+        return os.path.samefile(spec.origin, __file__)
+    except OSError:
+        return False
+
+
+def _init_scene_worker(dataset_name, encode_workers, hw_encode_sessions):
+    """
+    Open the dataset and an encode pool once per worker process, and adopt
+    the run-wide hardware encode semaphore so the session cap holds across
+    all workers rather than per process.
+    """
+    global _hw_encode_sessions
+    _hw_encode_sessions = hw_encode_sessions
+    _worker_state["dataset"] = fo.load_dataset(dataset_name)
+    _worker_state["executor"] = ThreadPoolExecutor(max_workers=encode_workers)
+    _worker_state["dir_videos_cache"] = {}
+
+
+def _process_one_scene(task):
+    """
+    Worker entry point: process the scene named in ``task``.
+
+    Args:
+        task: ``(scene_id, scene_id_field, image_sensors, scene_params)``
+            where ``scene_params`` are keyword arguments for ``_process_scene``
+
+    Returns:
+        tuple: ``(scene_id, result dict from _process_scene)``
+    """
+    scene_id, scene_id_field, image_sensors, scene_params = task
+    dataset = _worker_state["dataset"]
+
+    view = dataset.select_group_slices(image_sensors) if image_sensors else dataset
+    scene_view = view.match(F(scene_id_field) == scene_id).sort_by(scene_params["timestamp_field"])
+
+    logger.info("Processing scene group: %s", scene_id)
+    result = _process_scene(
+        scene_view,
+        scene_id,
+        dataset,
+        _worker_state["executor"],
+        _worker_state["dir_videos_cache"],
+        **scene_params,
+    )
+    return scene_id, result
+
+
 # ------------------------------
 # Core processing
 # ------------------------------
@@ -387,118 +1388,236 @@ def _process_grouped_dataset(
     use_generated=False,
     target_sensors=None,
     video_path_field="video_path",
+    max_workers=None,
+    threads_per_encode=None,
+    scene_workers=1,
+    fuse_sensor_encodes=False,
+    encoder=None,
+    encoder_preset=None,
+    crf=None,
 ):
     """
     Process a grouped dataset by scene_id, creating videos for each sensor/camera.
 
+    Encodes for all sensors of a scene run concurrently on a pool of
+    ``max_workers`` threads (each thread drives one ffmpeg subprocess using
+    ``threads_per_encode`` encoder threads; either defaults from the other
+    and the CPU count). With ``scene_workers > 1`` scenes are also spread over that many worker
+    processes, each with its own database connection and a share of the
+    encode threads; ``scene_workers=0`` picks up to ``MAX_AUTO_SCENE_WORKERS``
+    from the CPU and scene counts, or stays in-process when worker processes
+    could not import the plugin (see ``_scene_workers_supported``).
+
+    ``encoder`` (None = ``detect_encoder()``, resolved once up front),
+    ``encoder_preset`` and ``crf`` (None = per-encoder defaults) select how
+    image frames are encoded.
+
+    Scenes whose samples all have ``video_path_field`` set already are
+    skipped. Finished scenes are recorded in a per-dataset manifest (see
+    ``MANIFEST_DIR``); on later runs a recorded video that still matches the
+    scene's frames is reused without re-encoding, and its path written back.
+
     Returns:
         dict: Results summary
     """
     # Dynamic groups by scene with ordering
     # First select all image sensor slices to ensure all sensors are included
+    requested_sensors = None
+    image_sensors = None
+    source_view = dataset
     if dataset.media_type == "group":
         available_media_types = dataset.group_media_types
         image_sensors = [sensor for sensor, media_type in available_media_types.items() if media_type == "image"]
+        requested_sensors = [s for s in image_sensors if not target_sensors or s in target_sensors]
         if image_sensors:
             # Create a view that includes all image sensor slices before grouping
-            all_sensors_view = dataset.select_group_slices(image_sensors)
-            grouped_view = all_sensors_view.group_by(scene_id_field, order_by=timestamp_field)
-        else:
-            grouped_view = dataset.group_by(scene_id_field, order_by=timestamp_field)
-    else:
-        grouped_view = dataset.group_by(scene_id_field, order_by=timestamp_field)
+            source_view = dataset.select_group_slices(image_sensors)
+    grouped_view = source_view.group_by(scene_id_field, order_by=timestamp_field)
 
     # Public way to confirm dynamic groups (older FO may not have this; default True)
     is_dyn = getattr(grouped_view, "outputs_dynamic_groups", lambda: True)()
     if not is_dyn:
         raise RuntimeError("Expected a dynamic-groups view from group_by()")
 
-    # Count scene groups for logging
-    n_scenes = sum(1 for _ in grouped_view.iter_dynamic_groups())
-    print(f"Found {n_scenes} scene groups")
+    # Count scene groups with one distinct() rather than walking the groups;
+    # the scene worker path reuses the ids
+    scene_ids = source_view.distinct(scene_id_field)
+    logger.info("Found %d scene groups", len(scene_ids))
+
+    max_workers, threads_per_encode = _resolve_encode_parallelism(max_workers, threads_per_encode)
+    workers_supported = _scene_workers_supported()
+    if scene_workers == 0:
+        # Auto only goes multi-process where workers can import the plugin
+        if workers_supported:
+            scene_workers = min(MAX_AUTO_SCENE_WORKERS, os.cpu_count() or 1, len(scene_ids))
+        else:
+            scene_workers = 1
+    scene_workers = max(1, scene_workers or 1)
+    if scene_workers > 1 and not workers_supported:
+        logger.warning("⚠️ Scene worker processes unavailable for this import; processing scenes in-process")
+        scene_workers = 1
+    logger.info(
+        "Running up to %d parallel encodes (%d threads each) across %d scene worker(s)",
+        max_workers,
+        threads_per_encode,
+        scene_workers,
+    )
+
+    # Probe the encoder here, once, rather than lazily from the encode
+    # threads: concurrent first calls each run the trial encodes, as
+    # lru_cache does not serialize them. Scene workers inherit the result
+    if encoder is None:
+        encoder = detect_encoder()
+    logger.info("Encoding with %s", encoder)
+
+    scene_params = dict(
+        timestamp_field=timestamp_field,
+        fps=fps,
+        use_fps_override=use_fps_override,
+        timestamps_in_seconds=timestamps_in_seconds,
+        use_generated=use_generated,
+        target_sensors=target_sensors,
+        video_path_field=video_path_field,
+        fuse_sensor_encodes=fuse_sensor_encodes,
+        threads_per_encode=threads_per_encode,
+        encoder=encoder,
+        encoder_preset=encoder_preset,
+        crf=crf,
+        camera_sensors=requested_sensors,
+    )
 
     total_scenes = 0
     total_videos = 0
     total_samples_updated = 0
 
-    for scene_view in grouped_view.iter_dynamic_groups():
-        total_scenes += 1
-
-        first = scene_view.first()
-        scene_id = first[scene_id_field]
-        print(f"\nProcessing scene group: {scene_id}")
-
-        # Extract per-sensor frame sequences
-        print("  - Extracting frame paths:")
-        frame_sequences = get_frame_paths(
-            scene_view, use_generated=use_generated, target_sensors=target_sensors, dataset=dataset
-        )
-        if not frame_sequences:
-            print(f"  - No frame sequences found for scene {scene_id}; skipping")
-            continue
-
-        sensor_video_paths = {}
-
-        # Per-sensor processing
-        for sensor_name, frame_paths in frame_sequences.items():
-            if not frame_paths:
-                continue
-
-            # Filter samples by group name directly since scene_view doesn't have groups
-            sensor_samples = [s for s in scene_view if hasattr(s, 'group') and s.group and s.group.name == sensor_name]
-            
-            if not sensor_samples:
-                continue
-
-            # (a) Field-level: already annotated with a video path?
-            samples_with_videos = [s for s in sensor_samples if s.has_field(video_path_field) and s[video_path_field]]
-            if len(samples_with_videos) == len(sensor_samples):
-                existing_paths = [s[video_path_field] for s in samples_with_videos]
-                if existing_paths:
-                    # Use the first path (assume uniform)
-                    existing = existing_paths[0]
-                    print(f"  - {sensor_name}: video already set in fields → {existing}")
-                    sensor_video_paths[sensor_name] = existing
-                    continue
-
-            # (b) On-disk check (derive dir from first frame)
-            first_frame_dir = os.path.dirname(frame_paths[0])
-            video_output_path = os.path.join(
-                first_frame_dir, f"scene_{scene_id}_{sensor_name}_generated.mp4"
-            )
-            if os.path.exists(video_output_path):
-                print(f"  - {sensor_name}: found existing on disk → {video_output_path}")
-                sensor_video_paths[sensor_name] = video_output_path
-                continue
-
-            # FPS
-            if use_fps_override and fps is not None:
-                video_fps = fps
-            else:
-                video_fps = calculate_fps_from_timestamps(
-                    sensor_samples, timestamp_field, timestamps_in_seconds
-                )
-
-            print(f"  - {sensor_name}: creating video @ {video_fps:.3f} fps → {video_output_path}")
-            ok = create_video_from_frames(frame_paths, video_output_path, fps=video_fps)
-            if ok:
-                sensor_video_paths[sensor_name] = video_output_path
-                total_videos += 1
-                print(f"    ✓ Created {video_output_path}")
-            else:
-                print(f"    ✗ Failed to create video for {sensor_name}")
+    # Manifest of previous runs; ignored if the field was removed since
+    manifest = _load_manifest(dataset.name)
+    manifest_key = f"{scene_id_field}/{video_path_field}"
+    has_video_field = video_path_field in dataset.get_field_schema()
+    if not has_video_field:
+        manifest.pop(manifest_key, None)
+    scene_manifest = manifest.setdefault(manifest_key, {})
+
+    # Scenes with a requested-sensor sample still missing its video path,
+    # from one distinct() query; all other scenes are skipped up front
+    pending_scenes = None
+    if has_video_field:
+        pending_view = dataset.select_group_slices(requested_sensors) if requested_sensors else source_view
+        pending_scenes = set(pending_view.exists(video_path_field, False).distinct(scene_id_field))
+
+    def skip_scene(scene_id):
+        if pending_scenes is not None and scene_id not in pending_scenes:
+            logger.info("  - Scene %s already has %s set on every sample; skipping", scene_id, video_path_field)
+            return True
+        return False
 
-        # Write field back per sample for produced sensors
-        updated = 0
-        for s in scene_view:
-            sname = s.group.name  # NOTE: using .name per your environment/version
-            if sname in sensor_video_paths:
-                s.set_field(video_path_field, sensor_video_paths[sname])
-                s.save()
-                updated += 1
+    def manifest_videos(scene_id):
+        # A pending scene is always processed so its paths get written back;
+        # the manifest only saves re-encoding (or re-listing) its videos
+        manifest_entry = scene_manifest.get(str(scene_id))
+        if (
+            requested_sensors is None
+            or manifest_entry is None
+            or not _manifest_covers(manifest_entry, requested_sensors)
+        ):
+            return None
+        return {
+            sensor: manifest_entry[sensor]
+            for sensor in requested_sensors
+            if manifest_entry[sensor] is not None
+        }
+
+    # Manifest writes are batched rather than rewritten per scene
+    unsaved_scenes = 0
+    last_manifest_save = time.monotonic()
+
+    def flush_manifest():
+        nonlocal unsaved_scenes, last_manifest_save
+        if unsaved_scenes:
+            _save_manifest(dataset.name, manifest)
+        unsaved_scenes = 0
+        last_manifest_save = time.monotonic()
+
+    def record(scene_id, result):
+        nonlocal total_videos, total_samples_updated, unsaved_scenes
+        total_videos += result["videos_created"]
+        total_samples_updated += result["samples_updated"]
+        if requested_sensors is None or not result["frame_sensors"]:
+            return
+        entry = scene_manifest.setdefault(str(scene_id), {})
+        for sensor in requested_sensors:
+            if sensor in result["sensor_video_paths"]:
+                video_path = result["sensor_video_paths"][sensor]
+                mtime = _file_mtime(video_path)
+                if mtime is not None:
+                    entry[sensor] = {"video_path": video_path, "mtime": mtime}
+                    first_frame = result["frame_sensors"].get(sensor)
+                    if first_frame is not None:
+                        entry[sensor]["first_frame"] = first_frame
+                        entry[sensor]["first_frame_mtime"] = _file_mtime(first_frame)
+            elif sensor not in result["frame_sensors"]:
+                entry[sensor] = None
+        unsaved_scenes += 1
+        if unsaved_scenes >= MANIFEST_SAVE_EVERY or time.monotonic() - last_manifest_save >= MANIFEST_SAVE_INTERVAL:
+            flush_manifest()
 
-        total_samples_updated += updated
-        print(f"  - Updated {video_path_field} for {updated} samples in scene {scene_id}")
+    try:
+        if scene_workers > 1:
+            tasks = []
+            for scene_id in scene_ids:
+                total_scenes += 1
+                if not skip_scene(scene_id):
+                    task_params = dict(scene_params, known_videos=manifest_videos(scene_id))
+                    tasks.append((scene_id, scene_id_field, image_sensors, task_params))
+
+            encode_workers = max(1, max_workers // scene_workers)
+            mp_context = multiprocessing.get_context("spawn")
+            hw_encode_sessions = mp_context.BoundedSemaphore(MAX_HW_ENCODE_SESSIONS)
+            # A worker that dies (or whose initializer fails) breaks the
+            # executor and raises here, rather than being respawned forever
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=scene_workers,
+                    mp_context=mp_context,
+                    initializer=_init_scene_worker,
+                    initargs=(dataset.name, encode_workers, hw_encode_sessions),
+                ) as pool:
+                    futures = [pool.submit(_process_one_scene, task) for task in tasks]
+                    for future in as_completed(futures):
+                        record(*future.result())
+            except BrokenProcessPool as e:
+                raise RuntimeError(f"A scene worker process died: {e}") from e
+            finally:
+                # Workers wrote through their own connections, possibly adding
+                # video_path_field to the schema behind this handle
+                dataset.reload()
+        else:
+            # Frame directory -> names of .mp4 files in it, shared across scenes
+            dir_videos_cache = {}
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for scene_view in grouped_view.iter_dynamic_groups():
+                    total_scenes += 1
+
+                    # Project just the scene id of one sample instead of loading it
+                    scene_id = scene_view.limit(1).values(scene_id_field)[0]
+                    logger.info("Processing scene group: %s", scene_id)
+
+                    if skip_scene(scene_id):
+                        continue
+
+                    result = _process_scene(
+                        scene_view,
+                        scene_id,
+                        dataset,
+                        executor,
+                        dir_videos_cache,
+                        known_videos=manifest_videos(scene_id),
+                        **scene_params,
+                    )
+                    record(scene_id, result)
+    finally:
+        flush_manifest()
 
     results = {
         "total_scenes_processed": total_scenes,
@@ -513,10 +1632,12 @@ def _process_grouped_dataset(
         "video_path_field": video_path_field,
     }
 
-    print("\n🎉 Video creation completed!")
-    print(f"  - Processed {total_scenes} scenes")
-    print(f"  - Created {total_videos} videos")
-    print(f"  - Updated {total_samples_updated} samples")
+    logger.info(
+        "🎉 Video creation completed! Processed %d scenes, created %d videos, updated %d samples",
+        total_scenes,
+        total_videos,
+        total_samples_updated,
+    )
 
     return results
 
@@ -7,11 +7,28 @@ This script removes video fields from datasets and deletes the corresponding vid
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import fiftyone as fo
 from pathlib import Path
 
+# The run manifest lives with the plugin; import its helpers rather than
+# keeping a second copy of its location and format here
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from __init__ import clear_manifest
 
-def reset_dataset_videos(dataset_name, video_field_name="video_path", delete_videos=True, dry_run=False):
+
+# Concurrent stats/unlinks; file I/O overlaps well on network storage
+MAX_IO_WORKERS = 32
+
+
+def _all_samples(dataset):
+    """View of every sample, flattening all group slices of a grouped dataset."""
+    if dataset.media_type == "group":
+        return dataset.select_group_slices(_allow_mixed=True)
+    return dataset
+
+
+def reset_dataset_videos(dataset_name, video_field_name="video_path", delete_videos=True, dry_run=False, verbose=False):
     """
     Reset video fields and files for a dataset.
     
@@ -20,6 +37,7 @@ def reset_dataset_videos(dataset_name, video_field_name="video_path", delete_vid
         video_field_name: Name of the video path field to remove (default: "video_path")
         delete_videos: Whether to delete the actual video files (default: True)
         dry_run: If True, only show what would be done without making changes (default: False)
+        verbose: If True, list every video found and deleted (default: False)
     
     Returns:
         dict: Summary of operations performed
@@ -35,9 +53,10 @@ def reset_dataset_videos(dataset_name, video_field_name="video_path", delete_vid
         print(f"- Media type: {dataset.media_type}")
         
         # Check if the video field exists
-        if video_field_name not in dataset.get_field_schema():
+        schema = dataset.get_field_schema()
+        if video_field_name not in schema:
             print(f"❌ Field '{video_field_name}' not found in dataset schema")
-            print(f"Available fields: {list(dataset.get_field_schema().keys())}")
+            print(f"Available fields: {list(schema.keys())}")
             return {"error": f"Field '{video_field_name}' not found"}
         
         print(f"- Video field '{video_field_name}' found in schema")
@@ -48,26 +67,20 @@ def reset_dataset_videos(dataset_name, video_field_name="video_path", delete_vid
         
         print(f"\n📋 Scanning dataset for video files...")
         
-        if dataset.media_type == "group":
-            # For grouped datasets, iterate through all samples
-            for sample in dataset:
-                if sample.has_field(video_field_name):
-                    video_path = sample.get_field(video_field_name)
-                    if video_path and isinstance(video_path, str) and os.path.exists(video_path):
-                        video_files_to_delete.add(video_path)
-                        samples_with_videos += 1
-                        if not dry_run:
-                            print(f"  Found video: {os.path.basename(video_path)}")
-        else:
-            # For regular datasets
-            for sample in dataset:
-                if sample.has_field(video_field_name):
-                    video_path = sample.get_field(video_field_name)
-                    if video_path and isinstance(video_path, str) and os.path.exists(video_path):
-                        video_files_to_delete.add(video_path)
-                        samples_with_videos += 1
-                        if not dry_run:
-                            print(f"  Found video: {os.path.basename(video_path)}")
+        # Distinct paths and their sample counts across all slices, deduped
+        # by the database, so no per-sample path list is held here; each
+        # distinct path is stat'ed once, concurrently
+        path_counts = _all_samples(dataset).count_values(video_field_name)
+        candidates = [p for p in path_counts if p and isinstance(p, str)]
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(candidates))) as executor:
+                found = executor.map(os.path.exists, candidates)
+                video_files_to_delete = {p for p, exists in zip(candidates, found) if exists}
+        samples_with_videos = sum(path_counts[p] for p in video_files_to_delete)
+        
+        if verbose and not dry_run and video_files_to_delete:
+            # One write for the whole listing
+            print("\n".join(f"  Found video: {os.path.basename(p)}" for p in sorted(video_files_to_delete)))
         
         print(f"\n📊 Summary:")
         print(f"- Samples with videos: {samples_with_videos}")
@@ -93,30 +106,38 @@ def reset_dataset_videos(dataset_name, video_field_name="video_path", delete_vid
         if delete_videos and video_files_to_delete:
             print(f"\n🗑️  Deleting video files...")
             
-            for video_path in video_files_to_delete:
-                try:
-                    if os.path.exists(video_path):
-                        os.remove(video_path)
+            # Files were checked for existence during the scan, so just
+            # unlink them concurrently and report missing ones separately
+            deleted_lines = []
+            with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(video_files_to_delete))) as executor:
+                futures = {executor.submit(os.remove, video_path): video_path for video_path in video_files_to_delete}
+                for future in as_completed(futures):
+                    video_path = futures[future]
+                    try:
+                        future.result()
                         deleted_files += 1
-                        print(f"  ✅ Deleted: {os.path.basename(video_path)}")
-                    else:
+                        if verbose:
+                            deleted_lines.append(f"  ✅ Deleted: {os.path.basename(video_path)}")
+                    except FileNotFoundError:
                         print(f"  ⚠️  File not found: {video_path}")
-                except Exception as e:
-                    failed_deletions.append((video_path, str(e)))
-                    print(f"  ❌ Failed to delete {os.path.basename(video_path)}: {e}")
+                    except Exception as e:
+                        failed_deletions.append((video_path, str(e)))
+                        print(f"  ❌ Failed to delete {os.path.basename(video_path)}: {e}")
+            if deleted_lines:
+                print("\n".join(deleted_lines))
         
         # Remove video field from samples
         print(f"\n🧹 Removing video field from dataset...")
         
-        samples_updated = 0
-        for sample in dataset:
-            if sample.has_field(video_field_name):
-                sample.clear_field(video_field_name)
-                sample.save()
-                samples_updated += 1
+        # delete_sample_field() unsets the field on every sample in one
+        # operation; the affected samples were already counted by the scan
+        samples_updated = sum(count for path, count in path_counts.items() if path is not None)
         
-        # Remove field from schema
+        # Remove field from samples and schema
         dataset.delete_sample_field(video_field_name)
+
+        if clear_manifest(dataset.name, video_field_name):
+            print(f"✅ Cleared run manifest entries for '{video_field_name}'")
         
         print(f"✅ Removed field '{video_field_name}' from {samples_updated} samples")
         print(f"✅ Removed field '{video_field_name}' from dataset schema")
@@ -154,6 +175,7 @@ def main():
     parser.add_argument("--field", default="video_path", help="Video field name to remove (default: video_path)")
     parser.add_argument("--keep-videos", action="store_true", help="Keep video files, only remove field from dataset")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
+    parser.add_argument("--verbose", action="store_true", help="List every video file found and deleted")
     
     args = parser.parse_args()
     
@@ -162,7 +184,8 @@ def main():
         dataset_name=args.dataset_name,
         video_field_name=args.field,
         delete_videos=not args.keep_videos,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        verbose=args.verbose
     )
     
     if result.get("error"):
@@ -9,36 +9,95 @@ Test script for enhanced fiftyone_video_creator features:
 import fiftyone as fo
 import tempfile
 import os
+import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
 
 
-def create_test_images_with_timestamps(output_dir, num_images, prefix="frame", fps=30):
-    """Create test images with realistic timestamps"""
-    image_paths = []
-    timestamp_interval = 1.0 / fps  # Time between frames in seconds
+class MockContext:
+    """Minimal stand-in for an operator ExecutionContext"""
+    __slots__ = ("dataset", "params")
     
-    for i in range(num_images):
-        # Create a simple test image with frame number
-        img = Image.new('RGB', (640, 480), color=(i * 10 % 255, (i * 20) % 255, (i * 30) % 255))
-        
-        # Add frame number text
-        draw = ImageDraw.Draw(img)
+    def __init__(self, dataset, params=None):
+        self.dataset = dataset
+        self.params = {} if params is None else params
+
+
+# Static parameter set used to exercise the operator's parameter handling
+_DEFAULT_PARAMS = {
+    "scene_id_field": "scene_id",
+    "timestamp_field": "timestamp",
+    "use_fps_override": False,
+    "use_generated": False,
+    "target_sensors": [],
+    "video_path_field": "video_path",
+}
+
+
+# Fonts loaded once per render thread (FreeType faces aren't shared across threads)
+_font_cache = threading.local()
+
+
+def _get_test_font():
+    """Label font for test frames, parsed once per thread"""
+    font = getattr(_font_cache, "font", None)
+    if font is None:
         try:
             font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
         except:
             font = ImageFont.load_default()
-        
-        timestamp = i * timestamp_interval
-        draw.text((50, 50), f"{prefix} {i:03d}", fill=(255, 255, 255), font=font)
-        draw.text((50, 100), f"t={timestamp:.3f}s", fill=(255, 255, 255), font=font)
-        
-        # Save image
-        image_path = os.path.join(output_dir, f"{prefix}_{i:03d}.jpg")
-        img.save(image_path)
-        image_paths.append((image_path, timestamp))
+        _font_cache.font = font
+    return font
+
+
+def _render_test_image(image_path, color, label, timestamp):
+    """Render and save one solid-color test frame with its label and timestamp"""
+    img = Image.new('RGB', (640, 480), color=color)
+    
+    # Add frame number text
+    draw = ImageDraw.Draw(img)
+    font = _get_test_font()
+    
+    draw.text((50, 50), label, fill=(255, 255, 255), font=font)
+    draw.text((50, 100), f"t={timestamp:.3f}s", fill=(255, 255, 255), font=font)
+    
+    # Save image
+    img.save(image_path)
+
+
+def _render_executor():
+    """Thread pool for rendering test frames (PIL releases the GIL while encoding)"""
+    return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+
+def create_test_images_with_timestamps(output_dir, num_images, prefix="frame", fps=30, executor=None):
+    """
+    Create test images with realistic timestamps
     
-    return image_paths
+    Frames are rendered and JPEG-encoded on ``executor``, or on a pool of
+    this call's own if none is given
+    """
+    # Per-frame timestamps (seconds) and colors as arrays
+    frame_indices = np.arange(num_images)
+    timestamps = frame_indices * (1.0 / fps)
+    colors = np.stack([frame_indices * 10 % 255, frame_indices * 20 % 255, frame_indices * 30 % 255], axis=1)
+    
+    paths = [os.path.join(output_dir, f"{prefix}_{i:03d}.jpg") for i in range(num_images)]
+    render_args = (
+        _render_test_image,
+        paths,
+        map(tuple, colors.tolist()),
+        [f"{prefix} {i:03d}" for i in range(num_images)],
+        timestamps.tolist(),
+    )
+    if executor is None:
+        with _render_executor() as own_executor:
+            list(own_executor.map(*render_args))
+    else:
+        list(executor.map(*render_args))
+    
+    return list(zip(paths, timestamps.tolist()))
 
 
 def create_test_dataset_with_timestamps():
@@ -56,40 +115,50 @@ def create_test_dataset_with_timestamps():
     sensors = ["CAM_FRONT", "CAM_BACK"]
     fps_values = [30, 15]  # Different FPS for different scenes
     
-    samples = []
+    # Render every scene/sensor image sequence (20 frames each) on one shared
+    # thread pool; samples are built here once they're all on disk
+    jobs = []
     for scene_idx, scene_id in enumerate(scenes):
-        print(f"Creating data for scene: {scene_id}")
-        
-        # Create a group for this scene
-        group = fo.Group()
-        target_fps = fps_values[scene_idx]
-        
         for sensor in sensors:
             # Create directory for this scene/sensor
             scene_dir = os.path.join(temp_dir, scene_id, sensor)
             os.makedirs(scene_dir, exist_ok=True)
+            jobs.append((scene_dir, 20, f"{scene_id}_{sensor}", fps_values[scene_idx]))
+    
+    with _render_executor() as executor:
+        rendered = [create_test_images_with_timestamps(*job, executor=executor) for job in jobs]
+    rendered = iter(rendered)
+    
+    def iter_samples():
+        for scene_idx, scene_id in enumerate(scenes):
+            print(f"Creating data for scene: {scene_id}")
             
-            # Create test images with timestamps (20 frames per sensor)
-            image_data = create_test_images_with_timestamps(scene_dir, 20, f"{scene_id}_{sensor}", target_fps)
+            # Create a group for this scene
+            group = fo.Group()
+            target_fps = fps_values[scene_idx]
             
-            # Create samples for each frame in this sensor
-            for i, (image_path, timestamp) in enumerate(image_data):
-                sample = fo.Sample(
-                    filepath=image_path,
-                    group=group.element(sensor)  # Each sensor is a different element in the group
-                )
-                
-                # Add metadata
-                sample["scene_id"] = scene_id
-                sample["timestamp"] = timestamp
-                sample["sensor_name"] = sensor
-                sample["frame_number"] = i
-                sample["target_fps"] = target_fps  # For validation
+            for sensor in sensors:
+                image_data = next(rendered)
                 
-                samples.append(sample)
+                # Create samples for each frame in this sensor
+                for i, (image_path, timestamp) in enumerate(image_data):
+                    sample = fo.Sample(
+                        filepath=image_path,
+                        group=group.element(sensor)  # Each sensor is a different element in the group
+                    )
+                    
+                    # Add metadata
+                    sample["scene_id"] = scene_id
+                    sample["timestamp"] = timestamp
+                    sample["sensor_name"] = sensor
+                    sample["frame_number"] = i
+                    sample["target_fps"] = target_fps  # For validation
+                    
+                    yield sample
     
-    # Add samples to dataset
-    dataset.add_samples(samples)
+    # Stream samples into the dataset; add_samples() batches the generator
+    # itself, so the full sample list is never held in memory
+    dataset.add_samples(iter_samples())
     print(f"Created dataset with {len(dataset)} samples")
     print(f"Dataset media type: {dataset.media_type}")
     print(f"Group field: {dataset.group_field}")
@@ -97,18 +166,26 @@ def create_test_dataset_with_timestamps():
     return dataset, temp_dir
 
 
-def test_fps_calculation():
+def cleanup_test_dataset(dataset, temp_dir):
+    """Delete a test dataset and its image directory"""
+    import shutil
+    dataset.delete()
+    shutil.rmtree(temp_dir)
+
+
+def test_fps_calculation(test_data=None):
     """Test FPS calculation from timestamps"""
     print("\n🧪 Testing FPS calculation from timestamps...")
     
-    # Create test dataset
-    dataset, temp_dir = create_test_dataset_with_timestamps()
+    # Use the shared test dataset if given, else create (and clean up) one
+    owns_dataset = test_data is None
+    dataset, temp_dir = test_data if test_data is not None else create_test_dataset_with_timestamps()
     
     try:
         # Import the FPS calculation function
         import sys
         sys.path.append('/home/dangural/development/dan_plugins/fiftyone_video_creator')
-        from __init__ import calculate_fps_from_timestamps
+        from __init__ import calculate_fps_from_timestamp_values
         
         # Test FPS calculation for different scenes
         grouped_view = dataset.group_by("scene_id", order_by="timestamp")
@@ -119,14 +196,17 @@ def test_fps_calculation():
             
             print(f"\n📊 Testing scene: {scene_id} (target FPS: {target_fps})")
             
+            # Fetch the sensor and timestamp columns once for the scene
+            names, timestamps = scene_view.values(["sensor_name", "timestamp"])
+            names = np.asarray(names)
+            timestamps = np.asarray(timestamps, dtype=np.float64)
+            
             # Test with all samples in scene
-            all_samples = list(scene_view)
-            calculated_fps = calculate_fps_from_timestamps(all_samples, "timestamp")
+            calculated_fps = calculate_fps_from_timestamp_values(timestamps)
             
             # Test with individual sensors
             for sensor in ["CAM_FRONT", "CAM_BACK"]:
-                sensor_samples = [s for s in all_samples if s["sensor_name"] == sensor]
-                sensor_fps = calculate_fps_from_timestamps(sensor_samples, "timestamp")
+                sensor_fps = calculate_fps_from_timestamp_values(timestamps[names == sensor])
                 
                 accuracy = abs(sensor_fps - target_fps) / target_fps * 100
                 status = "✅" if accuracy < 5 else "⚠️"  # Within 5% accuracy
@@ -139,18 +219,118 @@ def test_fps_calculation():
         print(f"❌ FPS Calculation Test FAILED: {e}")
         raise
     finally:
-        # Cleanup
-        dataset.delete()
-        import shutil
-        shutil.rmtree(temp_dir)
+        if owns_dataset:
+            cleanup_test_dataset(dataset, temp_dir)
 
 
-def test_operator_ui():
+def test_non_contiguous_encode(test_data=None):
+    """Test that frame sets the image2 demuxer can't read are encoded via the concat list"""
+    print("\n🧪 Testing encode of a non-contiguous frame sequence...")
+    
+    import shutil
+    if shutil.which("ffmpeg") is None:
+        print("⚠️ ffmpeg not found; skipping encode test")
+        return
+    
+    # Use the shared test dataset if given, else create (and clean up) one
+    owns_dataset = test_data is None
+    dataset, temp_dir = test_data if test_data is not None else create_test_dataset_with_timestamps()
+    
+    try:
+        import sys
+        sys.path.append('/home/dangural/development/dan_plugins/fiftyone_video_creator')
+        from __init__ import create_video_from_frames
+        
+        # Every other frame, so the numbered-pattern fast path doesn't apply
+        frame_dir = os.path.join(temp_dir, "scene_001", "CAM_FRONT")
+        frame_paths = sorted(os.path.join(frame_dir, name) for name in os.listdir(frame_dir))[::2]
+        output_dir = os.path.join(temp_dir, "encode_test")
+        
+        clip_paths = [os.path.join(output_dir, f"clip_{i}.mp4") for i in range(2)]
+        for clip_path in clip_paths:
+            assert create_video_from_frames(frame_paths, clip_path, fps=15, encoder="libx264"), \
+                f"Encoding non-contiguous frames to {clip_path} failed"
+            assert os.path.getsize(clip_path) > 0, f"{clip_path} is empty"
+        print(f"✅ Encoded {len(frame_paths)} non-contiguous frames")
+        
+        # Video-clip inputs take the stream-copy concat path
+        joined_path = os.path.join(output_dir, "joined.mp4")
+        assert create_video_from_frames(clip_paths, joined_path), "Stream-copy concat of clips failed"
+        assert os.path.getsize(joined_path) > 0, f"{joined_path} is empty"
+        print("✅ Stream-copied clips into one video")
+        
+        print("✅ Non-contiguous Encode Test PASSED")
+        
+    except Exception as e:
+        print(f"❌ Non-contiguous Encode Test FAILED: {e}")
+        raise
+    finally:
+        if owns_dataset:
+            cleanup_test_dataset(dataset, temp_dir)
+
+
+def test_fused_encode(test_data=None):
+    """Test that several sensors are encoded by the single fused ffmpeg process"""
+    print("\n🧪 Testing fused multi-output encode...")
+    
+    import shutil
+    if shutil.which("ffmpeg") is None:
+        print("⚠️ ffmpeg not found; skipping encode test")
+        return
+    
+    # Use the shared test dataset if given, else create (and clean up) one
+    owns_dataset = test_data is None
+    dataset, temp_dir = test_data if test_data is not None else create_test_dataset_with_timestamps()
+    
+    try:
+        import sys
+        sys.path.append('/home/dangural/development/dan_plugins/fiftyone_video_creator')
+        import __init__ as plugin
+        
+        # One contiguous and one non-contiguous sequence, so both input kinds
+        # go through the fused command
+        output_dir = os.path.join(temp_dir, "fused_test")
+        jobs = []
+        for sensor, step in (("CAM_FRONT", 1), ("CAM_BACK", 2)):
+            frame_dir = os.path.join(temp_dir, "scene_001", sensor)
+            frame_paths = sorted(os.path.join(frame_dir, name) for name in os.listdir(frame_dir))[::step]
+            jobs.append((frame_paths, os.path.join(output_dir, f"{sensor}.mp4"), 15))
+        
+        assert plugin._can_fuse_encodes(jobs, "libx264"), "Jobs should be fusable with libx264"
+        
+        # Fail the per-job fallback, so passing means the fused run did the work
+        def no_fallback(*args, **kwargs):
+            raise AssertionError("fused encode fell back to per-job encodes")
+        
+        original = plugin.create_video_from_frames
+        plugin.create_video_from_frames = no_fallback
+        try:
+            results = plugin.create_videos_from_frame_sets(jobs, threads=1, encoder="libx264")
+        finally:
+            plugin.create_video_from_frames = original
+        
+        assert results == [True] * len(jobs), f"Fused encode results: {results}"
+        for _, output_path, _ in jobs:
+            assert os.path.getsize(output_path) > 0, f"{output_path} is empty"
+        print(f"✅ Encoded {len(jobs)} outputs in one ffmpeg process")
+        
+        print("✅ Fused Encode Test PASSED")
+        
+    except Exception as e:
+        print(f"❌ Fused Encode Test FAILED: {e}")
+        raise
+    finally:
+        if owns_dataset:
+            cleanup_test_dataset(dataset, temp_dir)
+
+
+def test_operator_ui(test_data=None):
     """Test that the operator UI resolves correctly with new features"""
     print("\n🧪 Testing operator UI resolution...")
     
-    # Create test dataset
-    dataset, temp_dir = create_test_dataset_with_timestamps()
+    # Use the shared test dataset if given, else create (and clean up) one
+    owns_dataset = test_data is None
+    dataset, temp_dir = test_data if test_data is not None else create_test_dataset_with_timestamps()
     
     try:
         import sys
@@ -161,11 +341,6 @@ def test_operator_ui():
         operator = CreateVideoAssetsPerScene()
         
         # Create mock context
-        class MockContext:
-            def __init__(self, dataset):
-                self.dataset = dataset
-                self.params = {}
-        
         ctx = MockContext(dataset)
         
         # Test resolve_input
@@ -175,14 +350,7 @@ def test_operator_ui():
         print(f"Input types: {type(inputs)}")
         
         # Test parameter extraction
-        ctx.params = {
-            "scene_id_field": "scene_id",
-            "timestamp_field": "timestamp", 
-            "use_fps_override": False,
-            "use_generated": False,
-            "target_sensors": [],
-            "video_path_field": "video_path"
-        }
+        ctx.params = _DEFAULT_PARAMS
         
         print("✅ Parameter handling works correctly")
         
@@ -190,18 +358,17 @@ def test_operator_ui():
         print(f"❌ Operator UI Test FAILED: {e}")
         raise
     finally:
-        # Cleanup
-        dataset.delete()
-        import shutil
-        shutil.rmtree(temp_dir)
+        if owns_dataset:
+            cleanup_test_dataset(dataset, temp_dir)
 
 
-def test_field_autocomplete():
+def test_field_autocomplete(test_data=None):
     """Test that field auto-complete works with dataset fields"""
     print("\n🧪 Testing field auto-complete...")
     
-    # Create test dataset with various fields
-    dataset, temp_dir = create_test_dataset_with_timestamps()
+    # Use the shared test dataset if given, else create (and clean up) one
+    owns_dataset = test_data is None
+    dataset, temp_dir = test_data if test_data is not None else create_test_dataset_with_timestamps()
     
     try:
         import sys
@@ -210,11 +377,6 @@ def test_field_autocomplete():
         
         operator = CreateVideoAssetsPerScene()
         
-        class MockContext:
-            def __init__(self, dataset):
-                self.dataset = dataset
-                self.params = {}
-        
         ctx = MockContext(dataset)
         
         # Test resolve_input with dataset context
@@ -240,10 +402,8 @@ def test_field_autocomplete():
         print(f"❌ Field Auto-complete Test FAILED: {e}")
         raise
     finally:
-        # Cleanup
-        dataset.delete()
-        import shutil
-        shutil.rmtree(temp_dir)
+        if owns_dataset:
+            cleanup_test_dataset(dataset, temp_dir)
 
 
 def main():
@@ -251,19 +411,30 @@ def main():
     print("🎬 Enhanced FiftyOne Video Creator Tests")
     print("=" * 60)
     
+    # All tests only read the dataset, so build it (and its images) once
+    test_data = create_test_dataset_with_timestamps()
+    
     try:
         # Test FPS calculation
-        test_fps_calculation()
+        test_fps_calculation(test_data)
+        
+        # Test encoding of non-contiguous frames
+        test_non_contiguous_encode(test_data)
+        
+        # Test the fused multi-output encode
+        test_fused_encode(test_data)
         
         # Test operator UI
-        test_operator_ui()
+        test_operator_ui(test_data)
         
         # Test field auto-complete
-        test_field_autocomplete()
+        test_field_autocomplete(test_data)
         
         print("\n" + "=" * 60)
         print("🎉 ALL TESTS PASSED!")
         print("✅ FPS calculation from timestamps works correctly")
+        print("✅ Non-contiguous frame sequences encode correctly")
+        print("✅ Fused multi-output encodes work")
         print("✅ Operator UI resolves with new features")
         print("✅ Field auto-complete functionality works")
         print("\n💡 The enhanced plugin is ready for use!")
@@ -271,6 +442,8 @@ def main():
     except Exception as e:
         print(f"\n❌ TESTS FAILED: {e}")
         raise
+    finally:
+        cleanup_test_dataset(*test_data)
 
 
 if __name__ == "__main__":
@@ -7,7 +7,6 @@ FiftyOne plugin SDK patterns from:
 https://docs.voxel51.com/plugins/using_plugins.html#executing-operators-via-sdk
 """
 
-import fiftyone as fo
 import fiftyone.operators as foo
 import sys
 import os
@@ -16,22 +15,31 @@ import asyncio
 # Add the plugin directory to Python path so we can import our operator
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from test_video_creator import load_test_dataset
+
 async def test_operator_via_sdk():
-    """Test the create_video_assets_per_scene operator via FiftyOne SDK with delegation."""
+    """
+    Test the create_video_assets_per_scene operator via FiftyOne SDK with delegation.
+    
+    Returns:
+        (success, dataset), where dataset is the loaded dataset (None if it
+        could not be loaded) so the caller can verify results without
+        loading it again
+    """
     
     print("=== Testing FiftyOne Video Creator Operator via SDK (Delegated) ===\n")
     
     # Load the dataset
     print("1. Loading dataset...")
     try:
-        dataset = fo.load_dataset("cosmos_search_test")
+        dataset = load_test_dataset("cosmos_search_test")
         print(f"✅ Successfully loaded dataset: {dataset.name}")
         print(f"   - Samples: {len(dataset)}")
         print(f"   - Media type: {dataset.media_type}")
         print(f"   - Fields: {list(dataset.get_field_schema().keys())}")
     except Exception as e:
         print(f"❌ Failed to load dataset: {e}")
-        return False
+        return False, None
     
     # Use the full dataset for delegated execution
     test_view = dataset  # Use full dataset since we're delegating
@@ -78,22 +86,22 @@ async def test_operator_via_sdk():
         
         if operation_id:
             # Wait for the operation to complete
-            success = wait_for_delegated_operation(operation_id)
+            success = await wait_for_delegated_operation(operation_id)
             if success:
                 print("\n5. Operation completed successfully!")
-                return True
+                return True, dataset
             else:
                 print("\n❌ Operation failed or timed out")
-                return False
+                return False, dataset
         else:
             print("❌ Could not get operation ID for polling")
-            return False
+            return False, dataset
             
     except Exception as e:
         print(f"❌ Failed to submit delegated operation: {e}")
         import traceback
         traceback.print_exc()
-        return False
+        return False, dataset
 
 def test_operator_with_delegation():
     """Test the operator with delegation (background execution)."""
@@ -101,7 +109,7 @@ def test_operator_with_delegation():
     print("\n=== Testing Operator with Delegation ===\n")
     
     # Load dataset
-    dataset = fo.load_dataset("cosmos_search_test")
+    dataset = load_test_dataset("cosmos_search_test")
     test_view = dataset.take(20)  # Even smaller subset for delegation test
     
     # Prepare context
@@ -133,47 +141,49 @@ def test_operator_with_delegation():
         traceback.print_exc()
         return False
 
-def wait_for_delegated_operation(operation_id, check_interval=10, max_wait_time=1800):
-    """Wait for a delegated operation to complete."""
+async def wait_for_delegated_operation(operation_id, check_interval=10, max_wait_time=1800):
+    """
+    Wait for a delegated operation to complete.
+    
+    Polls with exponential backoff starting at 0.5s and capped at
+    ``check_interval``, without blocking the event loop between polls.
+    """
     import time
-    import subprocess
+    from fiftyone.operators.delegated import DelegatedOperationService
+    from fiftyone.operators.executor import ExecutionRunState
     
     print(f"\n=== Waiting for Operation {operation_id} to Complete ===")
-    print(f"Checking every {check_interval} seconds, max wait time: {max_wait_time} seconds")
+    print(f"Checking every ≤{check_interval} seconds, max wait time: {max_wait_time} seconds")
     
+    # Read the operation's state in-process instead of spawning the CLI per poll
+    service = DelegatedOperationService()
     start_time = time.time()
+    attempt = 0
     
     while time.time() - start_time < max_wait_time:
+        delay = min(check_interval, 0.5 * 2 ** attempt)
+        attempt += 1
         try:
             # Check operation status
-            result = subprocess.run(
-                ["fiftyone", "delegated", "info", operation_id],
-                capture_output=True,
-                text=True,
-                cwd="/home/dangural/development/av_dataset_checklist"
-            )
+            operation = service.get(operation_id)
             
-            if result.returncode == 0:
-                output = result.stdout
-                if "State: COMPLETED" in output:
-                    print(f"✅ Operation {operation_id} completed successfully!")
-                    return True
-                elif "State: FAILED" in output:
-                    print(f"❌ Operation {operation_id} failed!")
-                    print("Error details:")
-                    print(output)
-                    return False
-                else:
-                    elapsed = int(time.time() - start_time)
-                    print(f"⏳ Operation {operation_id} still running... (elapsed: {elapsed}s)")
-                    time.sleep(check_interval)
+            if operation.run_state == ExecutionRunState.COMPLETED:
+                print(f"✅ Operation {operation_id} completed successfully!")
+                return True
+            elif operation.run_state == ExecutionRunState.FAILED:
+                print(f"❌ Operation {operation_id} failed!")
+                print("Error details:")
+                run_result = getattr(operation, "run_result", None)
+                print(getattr(run_result, "error", None) or run_result)
+                return False
             else:
-                print(f"Error checking operation status: {result.stderr}")
-                time.sleep(check_interval)
+                elapsed = int(time.time() - start_time)
+                print(f"⏳ Operation {operation_id} still running... (elapsed: {elapsed}s)")
+                await asyncio.sleep(delay)
                 
         except Exception as e:
             print(f"Exception while checking operation: {e}")
-            time.sleep(check_interval)
+            await asyncio.sleep(delay)
     
     print(f"⏰ Timeout: Operation {operation_id} did not complete within {max_wait_time} seconds")
     return False
@@ -183,30 +193,31 @@ def check_delegated_operations():
     print("\n=== Checking Delegated Operations Status ===\n")
     
     try:
-        # Use subprocess to run fiftyone delegated list
-        import subprocess
-        result = subprocess.run(
-            ["fiftyone", "delegated", "list", "--limit", "5"],
-            capture_output=True,
-            text=True,
-            cwd="/home/dangural/development/av_dataset_checklist"
+        # Query the delegated operation service directly rather than the CLI
+        from fiftyone.factory import DelegatedOperationPagingParams, SortByField, SortDirection
+        from fiftyone.operators.delegated import DelegatedOperationService
+        
+        paging = DelegatedOperationPagingParams(
+            limit=5, sort_by=SortByField.QUEUED_AT, sort_direction=SortDirection.DESCENDING
         )
+        operations = DelegatedOperationService().list_operations(paging=paging)
         
-        if result.returncode == 0:
-            print("Recent delegated operations:")
-            print(result.stdout)
-        else:
-            print(f"Error checking operations: {result.stderr}")
+        print("Recent delegated operations:")
+        for operation in operations:
+            print(f"  {operation.id}  {operation.run_state}  {operation.operator}  (queued {operation.queued_at})")
             
     except Exception as e:
         print(f"Failed to check operations: {e}")
 
-def verify_results():
+def verify_results(dataset=None):
     """Verify that videos were created and samples updated."""
     print("\n=== Verifying Results ===\n")
     
     try:
-        dataset = fo.load_dataset("cosmos_search_test")
+        # The handle predates the run; reload to see the new field
+        if dataset is None:
+            dataset = load_test_dataset("cosmos_search_test")
+        dataset.reload()
         
         # Check how many samples now have video_path field
         samples_with_videos = dataset.exists("video_path")
@@ -241,11 +252,11 @@ async def main():
     print("=" * 50)
     
     # Test 1: Delegated execution with await
-    success1 = await test_operator_via_sdk()
+    success1, dataset = await test_operator_via_sdk()
     
     if success1:
         print("\n" + "=" * 50)
-        verify_results()
+        verify_results(dataset)
     else:
         print("\n❌ Delegated execution failed")
     